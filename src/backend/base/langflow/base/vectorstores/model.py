@@ -17,15 +17,15 @@ if TYPE_CHECKING:
 def check_cached_vector_store(f):
     """Decorator to check for cached vector stores, and returns them if they exist.
 
-    Note: caching only occurs during the execution of a component - they do not persist
-    across separate invocations of the component. This method exists so that components with
-    multiple output methods share the same vector store during the same invocation of the
-    component.
+    Note: the cached store lives on the component instance, so components with multiple output
+    methods share the same vector store. Vertices reuse their component instance across builds
+    (e.g. in cycles or re-runs), so the cache also carries over between builds; components can
+    override `_is_cached_vector_store_stale` to rebuild when the inputs it was built from change.
     """
 
     @wraps(f)
     def check_cached(self, *args, **kwargs):
-        if self._cached_vector_store is not None:
+        if self._cached_vector_store is not None and not self._is_cached_vector_store_stale():
             return self._cached_vector_store
 
         result = f(self, *args, **kwargs)
@@ -52,6 +52,13 @@ class LCVectorStoreComponent(Component):
                 )
                 raise TypeError(msg)
 
+    def _is_cached_vector_store_stale(self) -> bool:
+        """Return True if the cached vector store was built from inputs that have since changed.
+
+        Components whose instances are reused across builds can override this to force a rebuild.
+        """
+        return False
+
     trace_type = "retriever"
     outputs = [
         Output(
@@ -1,3 +1,5 @@
+from concurrent import futures
+
 import assemblyai as aai
 from loguru import logger
 
@@ -5,6 +7,16 @@ from langflow.custom import Component
 from langflow.io import DataInput, DropdownInput, FloatInput, IntInput, MultilineInput, Output, SecretStrInput
 from langflow.schema import Data
 
+# Upper bound on concurrent transcript polls, to stay within AssemblyAI's rate limits
+MAX_CONCURRENT_TRANSCRIPT_POLLS = 16
+
+_MODEL_MAP = {
+    "claude3_5_sonnet": aai.LemurModel.claude3_5_sonnet,
+    "claude3_opus": aai.LemurModel.claude3_opus,
+    "claude3_haiku": aai.LemurModel.claude3_haiku,
+    "claude3_sonnet": aai.LemurModel.claude3_sonnet,
+}
+
 
 class AssemblyAILeMUR(Component):
     display_name = "AssemblyAI LeMUR"
@@ -87,29 +99,33 @@ class AssemblyAILeMUR(Component):
         """Use the LeMUR task endpoint to input the LLM prompt."""
         aai.settings.api_key = self.api_key
 
-        if not self.transcription_result and not self.transcript_ids:
+        transcription_result = self.transcription_result
+        result_data = transcription_result.data if transcription_result else None
+        raw_transcript_ids = self.transcript_ids
+        endpoint = self.endpoint
+
+        if not transcription_result and not raw_transcript_ids:
             error = "Either a Transcription Result or Transcript IDs must be provided"
             self.status = error
             return Data(data={"error": error})
-        if self.transcription_result and self.transcription_result.data.get("error"):
+        if result_data and result_data.get("error"):
             # error message from the previous step
-            self.status = self.transcription_result.data["error"]
-            return self.transcription_result
-        if self.endpoint == "task" and not self.prompt:
+            self.status = result_data["error"]
+            return transcription_result
+        if endpoint == "task" and not self.prompt:
             self.status = "No prompt specified for the task endpoint"
             return Data(data={"error": "No prompt specified"})
-        if self.endpoint == "question-answer" and not self.questions:
+        if endpoint == "question-answer" and not self.questions:
             error = "No Questions were provided for the question-answer endpoint"
             self.status = error
             return Data(data={"error": error})
 
         # Check for valid transcripts
         transcript_ids = None
-        if self.transcription_result and "id" in self.transcription_result.data:
-            transcript_ids = [self.transcription_result.data["id"]]
-        elif self.transcript_ids:
-            transcript_ids = self.transcript_ids.split(",") or []
-            transcript_ids = [t.strip() for t in transcript_ids]
+        if result_data and "id" in result_data:
+            transcript_ids = [result_data["id"]]
+        elif raw_transcript_ids:
+            transcript_ids = [t.strip() for t in raw_transcript_ids.split(",") if t.strip()]
 
         if not transcript_ids:
             error = "Either a valid Transcription Result or valid Transcript IDs must be provided"
@@ -117,8 +133,7 @@ class AssemblyAILeMUR(Component):
             return Data(data={"error": error})
 
         # Get TranscriptGroup and check if there is any error
-        transcript_group = aai.TranscriptGroup(transcript_ids=transcript_ids)
-        transcript_group, failures = transcript_group.wait_for_completion(return_failures=True)
+        transcript_group, failures = self.wait_for_transcripts(transcript_ids)
         if failures:
             error = f"Getting transcriptions failed: {failures[0]}"
             self.status = error
@@ -131,7 +146,7 @@ class AssemblyAILeMUR(Component):
 
         # Perform LeMUR action
         try:
-            response = self.perform_lemur_action(transcript_group, self.endpoint)
+            response = self.perform_lemur_action(transcript_group, endpoint)
         except Exception as e:  # noqa: BLE001
             logger.opt(exception=True).debug("Error running LeMUR")
             error = f"An Error happened: {e}"
@@ -142,8 +157,22 @@ class AssemblyAILeMUR(Component):
         self.status = result
         return result
 
+    def wait_for_transcripts(self, transcript_ids: list[str]) -> tuple[aai.TranscriptGroup, list[str]]:
+        """Poll the transcripts concurrently and group the ones that completed."""
+        transcript_group = aai.TranscriptGroup()
+        failures: list[str] = []
+        max_workers = min(len(transcript_ids), MAX_CONCURRENT_TRANSCRIPT_POLLS)
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = [executor.submit(aai.Transcript.get_by_id, t) for t in transcript_ids]
+            for future in pending:
+                try:
+                    transcript_group.add_transcript(future.result())
+                except aai.TranscriptError as e:
+                    failures.append(str(e))
+        return transcript_group, failures
+
     def perform_lemur_action(self, transcript_group: aai.TranscriptGroup, endpoint: str) -> dict:
-        logger.info("Endpoint:", endpoint, type(endpoint))
+        logger.debug("LeMUR endpoint: {}", endpoint)
         if endpoint == "task":
             result = transcript_group.lemur.task(
                 prompt=self.prompt,
@@ -158,8 +187,7 @@ class AssemblyAILeMUR(Component):
                 max_output_size=self.max_output_size,
             )
         elif endpoint == "question-answer":
-            questions = self.questions.split(",")
-            questions = [aai.LemurQuestion(question=q) for q in questions]
+            questions = [aai.LemurQuestion(question=q.strip()) for q in self.questions.split(",") if q.strip()]
             result = transcript_group.lemur.question(
                 questions=questions,
                 final_model=self.get_final_model(self.final_model),
@@ -173,13 +201,8 @@ class AssemblyAILeMUR(Component):
         return result.dict()
 
     def get_final_model(self, model_name: str) -> aai.LemurModel:
-        if model_name == "claude3_5_sonnet":
-            return aai.LemurModel.claude3_5_sonnet
-        if model_name == "claude3_opus":
-            return aai.LemurModel.claude3_opus
-        if model_name == "claude3_haiku":
-            return aai.LemurModel.claude3_haiku
-        if model_name == "claude3_sonnet":
-            return aai.LemurModel.claude3_sonnet
-        msg = f"Model name not supported: {model_name}"
-        raise ValueError(msg)
+        try:
+            return _MODEL_MAP[model_name]
+        except KeyError as e:
+            msg = f"Model name not supported: {model_name}"
+            raise ValueError(msg) from e
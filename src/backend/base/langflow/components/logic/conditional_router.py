@@ -1,7 +1,17 @@
+from collections.abc import Callable
+
 from langflow.custom import Component
 from langflow.io import BoolInput, DropdownInput, IntInput, MessageInput, MessageTextInput, Output
 from langflow.schema.message import Message
 
+_OPS = {
+    "equals": str.__eq__,
+    "not equals": str.__ne__,
+    "contains": lambda input_text, match_text: match_text in input_text,
+    "starts with": str.startswith,
+    "ends with": str.endswith,
+}
+
 
 class ConditionalRouterComponent(Component):
     display_name = "If-Else"
@@ -12,6 +22,10 @@ class ConditionalRouterComponent(Component):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__iteration_updated = False
+        self.__cached_eval: tuple[tuple, bool] | None = None
+        # (operator, comparison function) resolved for that operator
+        self.__compare: tuple[str, Callable[[str, str], bool] | None] | None = None
+        self.__iteration_key: str | None = None
 
     inputs = [
         MessageTextInput(
@@ -67,51 +81,68 @@ class ConditionalRouterComponent(Component):
 
     def _pre_run_setup(self):
         self.__iteration_updated = False
+        self.__cached_eval = None
+        # Resolve the operator once per run; _evaluate re-resolves it if the input changes afterwards
+        self.__compare = (self.operator, _OPS.get(self.operator))
+        # Rebuilt on first use, so it picks up an id assigned after __init__
+        self.__iteration_key = None
+
+    @staticmethod
+    def _compare(
+        op: Callable[[str, str], bool] | None, input_text: str, match_text: str, *, case_sensitive: bool
+    ) -> bool:
+        if op is None:
+            return False
 
-    def evaluate_condition(self, input_text: str, match_text: str, operator: str, *, case_sensitive: bool) -> bool:
         if not case_sensitive:
             input_text = input_text.lower()
             match_text = match_text.lower()
 
-        if operator == "equals":
-            return input_text == match_text
-        if operator == "not equals":
-            return input_text != match_text
-        if operator == "contains":
-            return match_text in input_text
-        if operator == "starts with":
-            return input_text.startswith(match_text)
-        if operator == "ends with":
-            return input_text.endswith(match_text)
-        return False
+        return bool(op(input_text, match_text))
+
+    def evaluate_condition(self, input_text: str, match_text: str, operator: str, *, case_sensitive: bool) -> bool:
+        return self._compare(_OPS.get(operator), input_text, match_text, case_sensitive=case_sensitive)
+
+    def _evaluate(self) -> bool:
+        # Both outputs need the same comparison result, so compute it once per run
+        key = (self.input_text, self.match_text, self.operator, self.case_sensitive)
+        if self.__cached_eval is not None and self.__cached_eval[0] == key:
+            return self.__cached_eval[1]
+        operator = key[2]
+        if self.__compare is None or self.__compare[0] != operator:
+            self.__compare = (operator, _OPS.get(operator))
+        result = self._compare(self.__compare[1], self.input_text, self.match_text, case_sensitive=self.case_sensitive)
+        self.__cached_eval = (key, result)
+        return result
 
     def iterate_and_stop_once(self, route_to_stop: str):
         if not self.__iteration_updated:
-            self.update_ctx({f"{self._id}_iteration": self.ctx.get(f"{self._id}_iteration", 0) + 1})
+            if self.__iteration_key is None:
+                self.__iteration_key = f"{self._id}_iteration"
+            iteration = self.ctx.get(self.__iteration_key, 0) + 1
+            self.update_ctx({self.__iteration_key: iteration})
             self.__iteration_updated = True
-            if self.ctx.get(f"{self._id}_iteration", 0) >= self.max_iterations and route_to_stop == self.default_route:
+            if iteration >= self.max_iterations and route_to_stop == self.default_route:
                 # We need to stop the other route
                 route_to_stop = "true_result" if route_to_stop == "false_result" else "false_result"
             self.stop(route_to_stop)
 
     def true_response(self) -> Message | str:
-        result = self.evaluate_condition(
-            self.input_text, self.match_text, self.operator, case_sensitive=self.case_sensitive
-        )
+        result = self._evaluate()
         if result:
-            self.status = self.message
+            message = self.message
+            self.status = message
             self.iterate_and_stop_once("false_result")
-            return self.message
+            return message
         self.iterate_and_stop_once("true_result")
         return ""
 
     def false_response(self) -> Message | str:
-        result = self.evaluate_condition(
-            self.input_text, self.match_text, self.operator, case_sensitive=self.case_sensitive
-        )
+        result = self._evaluate()
         if not result:
-            self.status = self.message
+            message = self.message
+            self.status = message
             self.iterate_and_stop_once("true_result")
-            return self.message
+            return message
         self.iterate_and_stop_once("false_result")
         return ""
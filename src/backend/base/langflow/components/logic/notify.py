@@ -42,5 +42,4 @@ class NotifyComponent(CustomComponent):
 
     def _set_successors_ids(self):
         self._vertex.is_state = True
-        successors = self._vertex.graph.successor_map.get(self._vertex.id, [])
-        return successors + self._vertex.graph.activated_vertices
+        return self._vertex.graph.successor_map.get(self._vertex.id, ())
@@ -1,3 +1,6 @@
+from itertools import islice
+from typing import Any
+
 from loguru import logger
 
 from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
@@ -15,6 +18,30 @@ from langflow.io import (
 )
 from langflow.schema import Data
 
+try:
+    from astrapy.authentication import UsernamePasswordTokenProvider
+    from astrapy.constants import Environment
+    from astrapy.info import CollectionVectorServiceOptions
+    from langchain_astradb import AstraDBVectorStore
+    from langchain_astradb.utils.astradb import SetupMode
+
+    _SETUP_MODES = {"Sync": SetupMode.SYNC, "Async": SetupMode.ASYNC, "Off": SetupMode.OFF}
+    _HAS_ASTRA = True
+except ImportError:
+    _HAS_ASTRA = False
+
+# astrapy's insert_many defaults, used when batch_size / bulk_insert_batch_concurrency are unset
+_DEFAULT_INSERT_CHUNK_SIZE = 50
+_DEFAULT_INSERT_CONCURRENCY = 20
+# Lower bound on documents per add_documents call, to keep embedding round-trips few
+_MIN_INGEST_SLICE_SIZE = 2000
+_DEFAULT_SETUP_MODE = "Sync"
+
+_SEARCH_TYPES = {
+    "Similarity with score threshold": "similarity_score_threshold",
+    "MMR (Max Marginal Relevance)": "mmr",
+}
+
 
 class HCDVectorStoreComponent(LCVectorStoreComponent):
     display_name: str = "Hyper-Converged Database"
@@ -23,6 +50,13 @@ class HCDVectorStoreComponent(LCVectorStoreComponent):
     name = "HCD"
     icon: str = "HCD"
 
+    # Last search args built, as (number_of_results/threshold key, search_filter, args)
+    _search_args_cache: tuple[tuple, dict | None, dict] | None = None
+    # (connection inputs, embedding) the cached vector store was built with
+    _vector_store_key: tuple[tuple, Any] | None = None
+    # Connections ingest_data has already been added to by this instance
+    _ingested_connections: frozenset[tuple] = frozenset()
+
     inputs = [
         StrInput(
             name="collection_name",
@@ -110,7 +144,7 @@ class HCDVectorStoreComponent(LCVectorStoreComponent):
             info="Configuration mode for setting up the vector store, with options like 'Sync', 'Async', or 'Off'.",
             options=["Sync", "Async", "Off"],
             advanced=True,
-            value="Sync",
+            value=_DEFAULT_SETUP_MODE,
         ),
         BoolInput(
             name="pre_delete_collection",
@@ -177,42 +211,38 @@ class HCDVectorStoreComponent(LCVectorStoreComponent):
 
     @check_cached_vector_store
     def build_vector_store(self):
-        try:
-            from langchain_astradb import AstraDBVectorStore
-            from langchain_astradb.utils.astradb import SetupMode
-        except ImportError as e:
+        if not _HAS_ASTRA:
             msg = (
-                "Could not import langchain Astra DB integration package. "
-                "Please install it with `pip install langchain-astradb`."
+                "Could not import the Astra DB integration packages. "
+                "Please install them with `pip install langchain-astradb astrapy`."
             )
-            raise ImportError(msg) from e
-
-        try:
-            from astrapy.authentication import UsernamePasswordTokenProvider
-            from astrapy.constants import Environment
-        except ImportError as e:
-            msg = "Could not import astrapy integration package. Please install it with `pip install astrapy`."
-            raise ImportError(msg) from e
+            raise ImportError(msg)
 
         try:
             if not self.setup_mode:
-                self.setup_mode = self._inputs["setup_mode"].options[0]
+                self.setup_mode = _DEFAULT_SETUP_MODE
 
-            setup_mode_value = SetupMode[self.setup_mode.upper()]
+            setup_mode_value = _SETUP_MODES.get(self.setup_mode)
+            if setup_mode_value is None:
+                # Values that don't match the dropdown options exactly, e.g. "sync"
+                setup_mode_value = SetupMode[self.setup_mode.upper()]
         except KeyError as e:
             msg = f"Invalid setup mode: {self.setup_mode}"
             raise ValueError(msg) from e
 
+        connection = self._vector_store_connection()
+        # A reused instance only inserts ingest_data into a given collection once, even when it is
+        # rebuilt for a new embedding object or switches back to a collection it used before
+        ingest = connection not in self._ingested_connections
+
         if not isinstance(self.embedding, dict):
             embedding_dict = {"embedding": self.embedding}
         else:
-            from astrapy.info import CollectionVectorServiceOptions
-
             dict_options = self.embedding.get("collection_vector_service_options", {})
-            dict_options["authentication"] = {
-                k: v for k, v in dict_options.get("authentication", {}).items() if k and v
-            }
-            dict_options["parameters"] = {k: v for k, v in dict_options.get("parameters", {}).items() if k and v}
+            authentication = {k: v for k, v in dict_options.get("authentication", {}).items() if k and v}
+            parameters = {k: v for k, v in dict_options.get("parameters", {}).items() if k and v}
+            # Build a cleaned copy rather than rewriting the caller's options in place
+            dict_options = {**dict_options, "authentication": authentication, "parameters": parameters}
             embedding_dict = {
                 "collection_vector_service_options": CollectionVectorServiceOptions.from_dict(dict_options)
             }
@@ -250,47 +280,85 @@ class HCDVectorStoreComponent(LCVectorStoreComponent):
             msg = f"Error initializing AstraDBVectorStore: {e}"
             raise ValueError(msg) from e
 
-        self._add_documents_to_vector_store(vector_store)
+        if ingest:
+            self._add_documents_to_vector_store(vector_store)
+            if self.ingest_data:
+                self._ingested_connections = self._ingested_connections | {connection}
+        self._vector_store_key = (connection, self.embedding)
         return vector_store
 
     def _add_documents_to_vector_store(self, vector_store) -> None:
-        documents = []
-        for _input in self.ingest_data or []:
-            if isinstance(_input, Data):
-                documents.append(_input.to_lc_document())
-            else:
-                msg = "Vector Store Inputs must be Data objects."
-                raise TypeError(msg)
-
-        if documents:
-            logger.debug(f"Adding {len(documents)} documents to the Vector Store.")
-            try:
-                vector_store.add_documents(documents)
-            except Exception as e:
-                msg = f"Error adding documents to AstraDBVectorStore: {e}"
-                raise ValueError(msg) from e
-        else:
+        ingest_data = self.ingest_data or []
+        # Validate everything up front so a bad input can't leave a partial ingest behind
+        if not all(isinstance(_input, Data) for _input in ingest_data):
+            msg = "Vector Store Inputs must be Data objects."
+            raise TypeError(msg)
+
+        if not ingest_data:
             logger.debug("No documents to add to the Vector Store.")
+            return
+
+        logger.debug(f"Adding {len(ingest_data)} documents to the Vector Store.")
+        # Convert and send in slices so only one slice of Documents is alive at a time. The store splits
+        # each call into batch_size chunks inserted concurrently, so a slice spans several chunks per worker.
+        chunk_size = self.batch_size or _DEFAULT_INSERT_CHUNK_SIZE
+        concurrency = self.bulk_insert_batch_concurrency or _DEFAULT_INSERT_CONCURRENCY
+        slice_size = max(chunk_size * concurrency, _MIN_INGEST_SLICE_SIZE)
+        documents = (_input.to_lc_document() for _input in ingest_data)
+        try:
+            while batch := list(islice(documents, slice_size)):
+                vector_store.add_documents(batch)
+        except Exception as e:
+            msg = f"Error adding documents to AstraDBVectorStore: {e}"
+            raise ValueError(msg) from e
 
     def _map_search_type(self) -> str:
-        if self.search_type == "Similarity with score threshold":
-            return "similarity_score_threshold"
-        if self.search_type == "MMR (Max Marginal Relevance)":
-            return "mmr"
-        return "similarity"
+        return _SEARCH_TYPES.get(self.search_type, "similarity")
 
     def _build_search_args(self):
+        key = (self.number_of_results, self.search_score_threshold)
+        search_filter = self.search_filter
+        if self._search_args_cache is not None:
+            cached_key, cached_filter, cached_args = self._search_args_cache
+            # The filter is compared by identity; keeping a reference to it means its id can't be reused
+            if cached_key == key and cached_filter is search_filter:
+                return cached_args
+
         args = {
             "k": self.number_of_results,
             "score_threshold": self.search_score_threshold,
         }
 
-        if self.search_filter:
-            clean_filter = {k: v for k, v in self.search_filter.items() if k and v}
+        if search_filter:
+            clean_filter = {k: v for k, v in search_filter.items() if k and v}
             if len(clean_filter) > 0:
                 args["filter"] = clean_filter
+        self._search_args_cache = (key, search_filter, args)
         return args
 
+    def _vector_store_connection(self) -> tuple:
+        """Return the connection inputs the built vector store depends on."""
+        return (
+            self.collection_name,
+            self.username,
+            self.password,
+            self.api_endpoint,
+            self.namespace,
+            self.metric,
+            self.setup_mode or _DEFAULT_SETUP_MODE,
+        )
+
+    def _is_cached_vector_store_stale(self) -> bool:
+        if self._vector_store_key is None:
+            return False
+        connection, embedding = self._vector_store_key
+        if connection != self._vector_store_connection():
+            return True
+        # Vectorize options arrive as a fresh dict on every upstream build, so compare them by value
+        if isinstance(embedding, dict) or isinstance(self.embedding, dict):
+            return embedding != self.embedding
+        return embedding is not self.embedding
+
     def search_documents(self) -> list[Data]:
         vector_store = self.build_vector_store()
 
@@ -318,8 +386,8 @@ class HCDVectorStoreComponent(LCVectorStoreComponent):
         return []
 
     def get_retriever_kwargs(self):
-        search_args = self._build_search_args()
         return {
             "search_type": self._map_search_type(),
-            "search_kwargs": search_args,
+            # Copied so the retriever can't mutate the cached args
+            "search_kwargs": dict(self._build_search_args()),
         }
@@ -7,7 +7,12 @@ def encode_callable(obj: Callable):
 
 
 def encode_datetime(obj: datetime):
-    return obj.strftime("%Y-%m-%d %H:%M:%S %Z")
+    # Equivalent to strftime("%Y-%m-%d %H:%M:%S %Z") without the format parser, except that years
+    # below 1000 are always zero-padded to four digits (glibc's %Y leaves them unpadded)
+    return (
+        f"{obj.year:04d}-{obj.month:02d}-{obj.day:02d} "
+        f"{obj.hour:02d}:{obj.minute:02d}:{obj.second:02d} {obj.tzname() or ''}"
+    )
 
 
-CUSTOM_ENCODERS = {Callable: encode_callable, datetime: encode_datetime}
+CUSTOM_ENCODERS = {datetime: encode_datetime, Callable: encode_callable}
@@ -1,10 +1,20 @@
 import asyncio
+from concurrent import futures
 
 
 def run_until_complete(coro):
+    """Run a coroutine to completion from synchronous code and return its result.
+
+    Without a running event loop the coroutine runs with `asyncio.run`. When called from inside a
+    running loop, the coroutine runs on a fresh loop in a worker thread and the calling thread blocks
+    until it finishes. The running loop is stalled for that time, so the coroutine must not depend on
+    it: anything that schedules work back onto the outer loop (e.g. `asyncio.run_coroutine_threadsafe`
+    or an async engine bound to it) will deadlock. From async code, await the coroutine instead.
+    """
     try:
-        loop = asyncio.get_running_loop()
+        asyncio.get_running_loop()
     except RuntimeError:
         # If there's no event loop, create a new one and run the coroutine
         return asyncio.run(coro)
-    return loop.run_until_complete(coro)
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+import pytest
+from langflow.components.logic.conditional_router import ConditionalRouterComponent
+
+
+def _router(**kwargs):
+    router = ConditionalRouterComponent(_id="router").set(message="routed", **kwargs)
+    router._vertex = MagicMock()
+    router._vertex.graph.context = {}
+    return router
+
+
+@pytest.mark.parametrize(
+    ("operator", "input_text", "match_text", "case_sensitive", "expected"),
+    [
+        ("equals", "Hello", "hello", False, True),
+        ("equals", "Hello", "hello", True, False),
+        ("not equals", "Hello", "hello", False, False),
+        ("not equals", "Hello", "hello", True, True),
+        ("contains", "Hello World", "WORLD", False, True),
+        ("contains", "Hello World", "WORLD", True, False),
+        ("starts with", "Hello World", "HELLO", False, True),
+        ("starts with", "Hello World", "HELLO", True, False),
+        ("ends with", "Hello World", "world", False, True),
+        ("ends with", "Hello World", "world", True, False),
+    ],
+)
+def test_outputs_follow_the_comparison(operator, input_text, match_text, case_sensitive, expected):
+    router = _router(input_text=input_text, match_text=match_text, operator=operator, case_sensitive=case_sensitive)
+    router._pre_run_setup()
+
+    assert router.true_response() == ("routed" if expected else "")
+    assert router.false_response() == ("" if expected else "routed")
+
+
+def test_unknown_operator_routes_false():
+    router = _router(input_text="a", match_text="a", operator="matches")
+    router._pre_run_setup()
+
+    assert router.true_response() == ""
+    assert router.false_response() == "routed"
+
+
+def test_comparison_runs_once_per_run(mocker):
+    router = _router(input_text="Hello", match_text="hello", operator="equals")
+    compare = mocker.spy(ConditionalRouterComponent, "_compare")
+
+    router._pre_run_setup()
+    router.true_response()
+    router.false_response()
+    assert compare.call_count == 1
+
+    # The next run must not reuse the previous result
+    router._pre_run_setup()
+    router.set(match_text="other")
+    assert router.true_response() == ""
+    assert router.false_response() == "routed"
+    assert compare.call_count == 2
+
+
+def test_outputs_work_without_pre_run_setup():
+    router = _router(input_text="Hello", match_text="hello", operator="equals")
+
+    assert router.true_response() == "routed"
+    assert router._vertex.graph.context == {"router_iteration": 1}
+
+
+def test_operator_changed_after_pre_run_setup():
+    router = _router(input_text="Hello World", match_text="world", operator="equals")
+    router._pre_run_setup()
+
+    router.set(operator="ends with")
+
+    assert router.true_response() == "routed"
+    assert router.false_response() == ""
@@ -0,0 +1,100 @@
+import pytest
+from langflow.components.vectorstores import hcd
+from langflow.components.vectorstores.hcd import HCDVectorStoreComponent
+from langflow.schema import Data
+
+
+class FakeAstraDBVectorStore:
+    instances: list["FakeAstraDBVectorStore"] = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.added: list = []
+        self.instances.append(self)
+
+    def add_documents(self, documents):
+        self.added.extend(documents)
+
+    def search(self, **kwargs):  # noqa: ARG002
+        return []
+
+
+@pytest.fixture
+def fake_store(monkeypatch):
+    FakeAstraDBVectorStore.instances = []
+    monkeypatch.setattr(hcd, "AstraDBVectorStore", FakeAstraDBVectorStore)
+    return FakeAstraDBVectorStore
+
+
+def _vectorize_options():
+    return {"collection_vector_service_options": {"provider": "nvidia", "modelName": "NV-Embed-QA"}}
+
+
+def _component(embedding):
+    return HCDVectorStoreComponent().set(
+        collection_name="docs",
+        username="user",
+        password="secret",  # noqa: S106
+        api_endpoint="http://localhost:8181",
+        embedding=embedding,
+        ingest_data=[Data(text="one"), Data(text="two")],
+        search_input="query",
+    )
+
+
+def test_search_and_build_share_the_store(fake_store):
+    component = _component(_vectorize_options())
+
+    component.search_documents()
+    store = component.build_vector_store()
+
+    assert fake_store.instances == [store]
+    assert len(store.added) == 2
+
+
+def test_equal_vectorize_options_reuse_the_store(fake_store):
+    component = _component(_vectorize_options())
+    store = component.build_vector_store()
+
+    component.set(embedding=_vectorize_options())
+
+    assert component.build_vector_store() is store
+    assert len(fake_store.instances) == 1
+
+
+@pytest.mark.usefixtures("fake_store")
+def test_new_embedding_object_rebuilds_without_reingesting():
+    component = _component(object())
+    first = component.build_vector_store()
+
+    component.set(embedding=object())
+    second = component.build_vector_store()
+
+    assert second is not first
+    assert len(first.added) == 2
+    assert second.added == []
+
+
+def test_new_collection_rebuilds_and_ingests(fake_store):
+    component = _component(_vectorize_options())
+    first = component.build_vector_store()
+
+    component.set(collection_name="other_docs")
+    component.search_documents()
+
+    second = fake_store.instances[-1]
+    assert second is not first
+    assert second.kwargs["collection_name"] == "other_docs"
+    assert len(second.added) == 2
+
+
+def test_switching_back_to_a_collection_does_not_reingest(fake_store):
+    component = _component(_vectorize_options())
+    component.build_vector_store()
+
+    component.set(collection_name="other_docs")
+    component.build_vector_store()
+    component.set(collection_name="docs")
+    component.build_vector_store()
+
+    assert [len(store.added) for store in fake_store.instances] == [2, 2, 0]
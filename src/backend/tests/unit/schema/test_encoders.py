@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from langflow.schema.encoders import CUSTOM_ENCODERS, encode_callable, encode_datetime
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc),
+        datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone(timedelta(hours=-3))),
+        datetime(2024, 6, 7, 8, 9, 10),  # noqa: DTZ001 - naive datetimes encode with an empty zone
+    ],
+)
+def test_encode_datetime_matches_strftime(value):
+    assert encode_datetime(value) == value.strftime("%Y-%m-%d %H:%M:%S %Z")
+
+
+def test_encode_datetime_pads_years_below_1000():
+    value = datetime(5, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert encode_datetime(value) == "0005-01-02 03:04:05 UTC"
+
+
+def test_encode_callable_uses_name_or_str():
+    class Unnamed:
+        def __call__(self):
+            pass
+
+        def __str__(self):
+            return "unnamed"
+
+    def named():
+        pass
+
+    assert encode_callable(named) == "named"
+    assert encode_callable(Unnamed()) == "unnamed"
+
+
+def test_custom_encoders_with_jsonable_encoder():
+    def named():
+        pass
+
+    value = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    encoded = jsonable_encoder({"fn": named, "method": "".join, "at": value}, custom_encoder=CUSTOM_ENCODERS)
+    assert encoded == {"fn": "named", "method": "join", "at": "2024-01-02 03:04:05 UTC"}
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+
+import pytest
+from langflow.utils.async_helpers import run_until_complete
+
+
+async def _current_thread_and_loop():
+    return threading.get_ident(), asyncio.get_running_loop()
+
+
+def test_run_until_complete_without_running_loop():
+    thread_id, loop = run_until_complete(_current_thread_and_loop())
+
+    assert thread_id == threading.get_ident()
+    assert loop.is_closed()
+
+
+async def test_run_until_complete_inside_running_loop(blockbuster):
+    # The calling loop is blocked while the coroutine runs in a worker thread
+    blockbuster.functions["threading.Lock.acquire"].deactivate()
+    outer_loop = asyncio.get_running_loop()
+
+    thread_id, loop = run_until_complete(_current_thread_and_loop())
+
+    assert thread_id != threading.get_ident()
+    assert loop is not outer_loop
+
+
+async def test_run_until_complete_inside_running_loop_propagates_errors(blockbuster):
+    blockbuster.functions["threading.Lock.acquire"].deactivate()
+
+    async def fail():
+        msg = "boom"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="boom"):
+        run_until_complete(fail())